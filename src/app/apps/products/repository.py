@@ -1,12 +1,34 @@
-from decimal import Decimal
-from typing import Optional, Sequence
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Optional, Sequence
 
 from fastapi import HTTPException, status
-from sqlalchemy import delete, func, inspect, select
+from sqlalchemy import (
+    ColumnElement,
+    and_,
+    delete,
+    func,
+    insert,
+    inspect,
+    literal,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
 from src.app.apps.products.models import Category, Product, ProductCategory
+from src.app.core.pagination import decode_cursor, encode_cursor
+
+DEFAULT_SORT = "-created_at"
+# sort -> (column, descending, id descending)
+SORTS = {
+    "-created_at": (Product.created_at, True, True),
+    "price": (Product.price, False, False),
+    "-price": (Product.price, True, False),
+}
 
 
 class ProductRepository:
@@ -66,6 +88,26 @@ class ProductRepository:
         await self.session.refresh(product)
         return product
 
+    async def bulk_upsert(self, rows: Sequence[dict[str, Any]]) -> int:
+        if not rows:
+            return 0
+        dialect = self.session.get_bind().dialect.name
+        if dialect == "mysql":
+            stmt = mysql_insert(Product).values(list(rows))
+            stmt = stmt.on_duplicate_key_update(
+                price=stmt.inserted.price, updated_at=func.now()
+            )
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(Product).values(list(rows))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Product.name],
+                set_={"price": stmt.excluded.price, "updated_at": func.now()},
+            )
+        else:
+            stmt = insert(Product).values(list(rows))
+        await self.session.execute(stmt)
+        return len(rows)
+
     async def sync_categories(
         self, *, product: Product, categories: Sequence[Category]
     ):
@@ -90,7 +132,8 @@ class ProductRepository:
         min_price: Decimal | None = None,
         max_price: Decimal | None = None,
         sort: str | None = None,
-    ) -> tuple[int, Sequence[Product]]:
+        cursor: str | None = None,
+    ) -> tuple[int | None, Sequence[Product], str | None]:
         stmt = select(Product).options(selectinload(Product.categories))
         if q:
             q = q.strip()
@@ -103,19 +146,58 @@ class ProductRepository:
         if category_id is not None:
             # stmt = stmt.join(Product.categories).where(Category.id == category_id)
             stmt = stmt.where(Product.categories.any(Category.id == category_id))
-        if sort == "price":
-            stmt = stmt.order_by(Product.price.asc(), Product.id.asc())
-        elif sort == "-price":
-            stmt = stmt.order_by(Product.price.desc(), Product.id.asc())
+        sort = sort if sort in SORTS else DEFAULT_SORT
+        column, descending, id_descending = SORTS[sort]
+        total: int | None = None
+        if cursor is None:
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+            total = (await self.session.execute(count_stmt)).scalar_one()
+            stmt = stmt.offset((page - 1) * limit)
         else:
-            stmt = stmt.order_by(Product.created_at.desc())
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        total: int = (await self.session.execute(count_stmt)).scalar_one()
-        offset = (page - 1) * limit
-        stmt = stmt.offset(offset).limit(limit)
-        res = await self.session.execute(stmt)
+            stmt = stmt.where(self._seek_after(sort, decode_cursor(cursor)))
+        stmt = stmt.order_by(
+            column.desc() if descending else column.asc(),
+            Product.id.desc() if id_descending else Product.id.asc(),
+        )
+        res = await self.session.execute(stmt.limit(limit + 1))
         items = res.scalars().all()
-        return (total, items)
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            key = getattr(last, column.key)
+            next_cursor = encode_cursor(
+                {
+                    "s": sort,
+                    "k": key.isoformat() if sort == DEFAULT_SORT else str(key),
+                    "i": last.id,
+                }
+            )
+        return (total, items, next_cursor)
+
+    def _seek_after(self, sort: str, payload: dict[str, Any]) -> ColumnElement[bool]:
+        column, descending, id_descending = SORTS[sort]
+        try:
+            if payload["s"] != sort:
+                raise ValueError("cursor sort mismatch")
+            last_id = int(payload["i"])
+            if sort == DEFAULT_SORT:
+                key: Any = datetime.fromisoformat(payload["k"])
+            else:
+                key = Decimal(payload["k"])
+        except (KeyError, TypeError, ValueError, InvalidOperation):
+            raise HTTPException(
+                detail="Invalid cursor", status_code=status.HTTP_400_BAD_REQUEST
+            )
+        left: ColumnElement[Any] = column
+        right: ColumnElement[Any] = literal(key, column.type)
+        if sort == DEFAULT_SORT and self.session.get_bind().dialect.name == "sqlite":
+            # SQLite keeps DATETIME as text and server defaults drop the
+            # microseconds, so compare on julianday instead of the raw strings.
+            left, right = func.julianday(left), func.julianday(right)
+        key_after = left < right if descending else left > right
+        id_after = Product.id < last_id if id_descending else Product.id > last_id
+        return or_(key_after, and_(left == right, id_after))
 
     async def create_with_categories(
         self,
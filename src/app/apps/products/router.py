@@ -79,11 +79,12 @@ async def list_products(
     sort: str | None = None,
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = None,
     session: AsyncSession = Depends(get_db_session),
 ):
     repo = ProductRepository(session)
 
-    total, products = await repo.list_with_filters(
+    total, products, next_cursor = await repo.list_with_filters(
         q=q,
         category_id=category_id,
         min_price=min_price,
@@ -91,9 +92,16 @@ async def list_products(
         sort=sort,
         page=page,
         limit=limit,
+        cursor=cursor,
     )
     items = [ProductResponse.model_validate(p) for p in products]
-    return Page(total=total, page=page, limit=limit, items=items)
+    return Page(
+        total=total,
+        page=page if cursor is None else None,
+        limit=limit,
+        items=items,
+        next_cursor=next_cursor,
+    )
 
 
 @router.post("/", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
@@ -39,7 +39,17 @@ T = TypeVar("T")
 
 
 class Page(BaseModel, Generic[T]):
-    total: int
-    page: int
+    total: int | None
+    page: int | None
     limit: int
     items: list[T]
+    next_cursor: str | None = None
+
+
+class ImportResult(BaseModel):
+    rows_read: int
+    rows_written: int
+    rows_skipped: int
+    rows_failed: int
+    elapsed_seconds: float
+    rows_per_second: float
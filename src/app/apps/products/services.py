@@ -1,9 +1,18 @@
 import asyncio
 import csv
-from decimal import Decimal
+import time
+from decimal import Decimal, InvalidOperation
+from itertools import islice
 from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.app.apps.products.repository import ProductRepository
+from src.app.apps.products.schemas import ImportResult
+
+IMPORT_BATCH_SIZE = 1000
+MAX_PRICE = Decimal("9999999999.99")
 
 
 async def demo_background_service(message: str) -> None:
@@ -11,20 +20,76 @@ async def demo_background_service(message: str) -> None:
     print(f"[SERVICE] {message}")
 
 
-async def import_products_from_csv(file_path: Path) -> None:
+def normalize_product_row(row: dict[str, Any]) -> dict[str, Any] | None:
+    name = (row.get("name") or "").strip()
+    if not name or len(name) > 255:
+        return None
+    try:
+        price = Decimal((row.get("price") or "").strip())
+    except InvalidOperation:
+        return None
+    if not price.is_finite() or price <= 0 or price > MAX_PRICE:
+        return None
+    return {"name": name, "price": price.quantize(Decimal("0.01"))}
+
+
+def chunked(
+    rows: Iterable[dict[str, Any]], size: int
+) -> Iterator[list[dict[str, Any]]]:
+    it = iter(rows)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+async def import_products(
+    session: AsyncSession, file_path: Path, *, batch_size: int = IMPORT_BATCH_SIZE
+) -> ImportResult:
+    repo = ProductRepository(session)
+    rows_read = rows_written = rows_skipped = rows_failed = 0
+    started = time.perf_counter()
+    with open(file_path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.DictReader(f)
+        for chunk in chunked(reader, batch_size):
+            rows_read += len(chunk)
+            batch: dict[str, dict[str, Any]] = {}
+            for raw in chunk:
+                row = normalize_product_row(raw)
+                if row is None:
+                    rows_failed += 1
+                    continue
+                if row["name"] in batch:
+                    rows_skipped += 1
+                batch[row["name"]] = row
+            rows_written += await repo.bulk_upsert(list(batch.values()))
+            await session.commit()
+    elapsed = time.perf_counter() - started
+    result = ImportResult(
+        rows_read=rows_read,
+        rows_written=rows_written,
+        rows_skipped=rows_skipped,
+        rows_failed=rows_failed,
+        elapsed_seconds=round(elapsed, 3),
+        rows_per_second=round(rows_read / elapsed, 1) if elapsed > 0 else 0.0,
+    )
+    print(
+        f"[IMPORT] {file_path.name}: {result.rows_read} read, "
+        f"{result.rows_written} written, {result.rows_skipped} skipped, "
+        f"{result.rows_failed} failed in {result.elapsed_seconds}s "
+        f"({result.rows_per_second} rows/s)"
+    )
+    return result
+
+
+async def import_products_from_csv(
+    file_path: Path, *, batch_size: int = IMPORT_BATCH_SIZE
+) -> ImportResult:
     from src.app.db.session import Database
     from src.app.settings import settings
 
     db = Database(settings.ASYNC_DATABASE_URL)
     try:
         async for session in db.get_session():
-            repo = ProductRepository(session)
-            async with session.begin():
-                with open(file_path, newline="") as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        name = row["name"].strip()
-                        price = Decimal(row["price"])
-                        await repo.create(name=name, price=price)
+            return await import_products(session, file_path, batch_size=batch_size)
+        raise RuntimeError("Database session unavailable")
     finally:
         await db.dispose()
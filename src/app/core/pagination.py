@@ -0,0 +1,24 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from fastapi import HTTPException, status
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError):
+        payload = None
+    if not isinstance(payload, dict):
+        raise HTTPException(
+            detail="Invalid cursor", status_code=status.HTTP_400_BAD_REQUEST
+        )
+    return payload
@@ -14,4 +14,5 @@ def import_products_csv_tasks(self, file_path: str):
 
     from src.app.apps.products.services import import_products_from_csv
 
-    asyncio.run(import_products_from_csv(Path(file_path)))
+    result = asyncio.run(import_products_from_csv(Path(file_path)))
+    return result.model_dump()
@@ -0,0 +1,52 @@
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.apps.products.models import Product
+from src.app.apps.products.repository import ProductRepository
+from src.app.apps.products.services import import_products
+
+
+def write_csv(path: Path, lines: list[str]) -> Path:
+    path.write_text("\n".join(["name,price", *lines]) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.mark.anyio
+async def test_import_products_in_batches(session: AsyncSession, tmp_path: Path):
+    csv_path = write_csv(
+        tmp_path / "feed.csv", [f"item {i},{i}.50" for i in range(1, 26)]
+    )
+    result = await import_products(session, csv_path, batch_size=10)
+    total = (await session.execute(select(func.count(Product.id)))).scalar_one()
+    assert total == 25
+    assert result.rows_read == 25
+    assert result.rows_written == 25
+    assert result.rows_failed == 0
+    assert result.rows_per_second > 0
+
+
+@pytest.mark.anyio
+async def test_import_products_upserts_and_rejects_invalid_rows(
+    session: AsyncSession, tmp_path: Path
+):
+    repo = ProductRepository(session)
+    await repo.create(name="Keyboard", price=Decimal("10.00"))
+    await session.commit()
+    csv_path = write_csv(
+        tmp_path / "feed.csv",
+        ["Keyboard,12.00", "Mouse,abc", ",5", "Monitor,-1", "Cable,3", "Cable,4"],
+    )
+    result = await import_products(session, csv_path)
+    assert result.rows_read == 6
+    assert result.rows_written == 2
+    assert result.rows_skipped == 1
+    assert result.rows_failed == 3
+    session.expire_all()
+    keyboard = await repo.get_by_name("Keyboard")
+    cable = await repo.get_by_name("Cable")
+    assert keyboard is not None and keyboard.price == Decimal("12.00")
+    assert cable is not None and cable.price == Decimal("4.00")
@@ -0,0 +1,54 @@
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.apps.products.repository import ProductRepository
+
+
+async def seed_products(session: AsyncSession, count: int) -> None:
+    repo = ProductRepository(session)
+    await repo.bulk_upsert(
+        [{"name": f"p{i:02d}", "price": Decimal(i % 4 + 1)} for i in range(count)]
+    )
+    await session.commit()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("sort", [None, "price", "-price"])
+async def test_cursor_pages_match_offset_pages(session: AsyncSession, sort):
+    await seed_products(session, 23)
+    repo = ProductRepository(session)
+    _, expected, _ = await repo.list_with_filters(page=1, limit=100, sort=sort)
+
+    seen = []
+    total, items, cursor = await repo.list_with_filters(page=1, limit=5, sort=sort)
+    assert total == 23
+    seen.extend(items)
+    while cursor is not None:
+        total, items, cursor = await repo.list_with_filters(
+            page=1, limit=5, sort=sort, cursor=cursor
+        )
+        assert total is None
+        seen.extend(items)
+    assert [p.id for p in seen] == [p.id for p in expected]
+
+
+@pytest.mark.anyio
+async def test_cursor_rejects_other_sort(session: AsyncSession):
+    await seed_products(session, 3)
+    repo = ProductRepository(session)
+    _, _, cursor = await repo.list_with_filters(page=1, limit=1, sort="price")
+    with pytest.raises(HTTPException):
+        await repo.list_with_filters(page=1, limit=1, sort="-price", cursor=cursor)
+
+
+@pytest.mark.anyio
+async def test_list_products_cursor_mode(async_client: AsyncClient):
+    res = await async_client.get("/products/", params={"cursor": "not-a-cursor"})
+    assert res.status_code == 400
+    res = await async_client.get("/products/")
+    assert res.status_code == 200
+    assert res.json()["next_cursor"] is None